@@ -1,15 +1,412 @@
 """
 Cache Configuration for FAQ Chatbot
-Enables response caching to reduce API calls and costs
+Enables semantic response caching to reduce API calls and costs
+
+Paraphrased questions ("What are your hours?" / "When are you open?")
+are matched by embedding similarity instead of exact prompt text.
 """
 
-from langchain_core.caches import InMemoryCache
+import hashlib
+import json
+import logging
+import os
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional, Tuple
+
+from langchain_core.caches import RETURN_VAL_TYPE, BaseCache
 from langchain_core.globals import set_llm_cache
 
-# Create cache instance
-cache = InMemoryCache()
+if TYPE_CHECKING:
+    from gptcache import Cache
+
+    from embedding import QuantizedMiniLM
+
+# Cache backend: "semantic" (default), "sqlite", "redis" or "memory"
+CACHE_BACKEND = os.getenv("LLM_CACHE_BACKEND", "semantic").lower()
+
+# Directory where the semantic cache stores its SQLite + FAISS files
+CACHE_DIR = ".gptcache"
+
+# Database file for the exact-match SQLite backend
+CACHE_PATH = os.getenv("LLM_CACHE_PATH", ".llm_cache.db")
+
+# Server for the exact-match Redis backend
+REDIS_URL = os.getenv("REDIS_URL", "redis://localhost:6379/0")
+
+# Minimum cosine similarity for a semantic cache hit. MiniLM scores
+# unrelated questions on the same subject ("accept PayPal?" / "accept
+# Bitcoin?") around 0.6-0.8, so only close paraphrases are accepted.
+MIN_COSINE_SIMILARITY = 0.9
+
+# Maximum entries kept by the semantic and memory backends (least recently
+# used entries are evicted first)
+CACHE_SIZE = int(os.getenv("LLM_CACHE_SIZE", "1024"))
+
+logger = logging.getLogger("faq.cache")
+
+
+def _split_messages(prompt: str) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+    """
+    Split a serialized chat prompt into system and non-system messages.
+
+    Args:
+        prompt (str): Prompt serialized by LangChain (JSON message list)
+
+    Returns:
+        tuple: (system, chat) - serialized kwargs of each message, oldest first
+    """
+    try:
+        messages = json.loads(prompt)
+    except (TypeError, ValueError):
+        return [], []
+
+    system, chat = [], []
+    for message in messages:
+        kwargs = message.get("kwargs", {})
+        (system if kwargs.get("type") == "system" else chat).append(kwargs)
+    return system, chat
+
+
+def _chat_messages(prompt: str) -> List[Dict[str, Any]]:
+    """
+    Get the non-system messages of a serialized chat prompt.
+
+    The system prompt is shared by every call, so keeping it out of the
+    embedded text stops it from drowning out the conversation. It is
+    still part of the cache key (see _system_digest).
+
+    Args:
+        prompt (str): Prompt serialized by LangChain (JSON message list)
+
+    Returns:
+        list: Serialized kwargs of each history/user message, oldest first
+    """
+    return _split_messages(prompt)[1]
+
+
+def _system_digest(prompt: str) -> str:
+    """
+    Get a short hash of the system messages (instructions + FAQ text).
+
+    Semantic cache entries are partitioned by this hash, so editing the
+    FAQ data invalidates every answer built from the old text.
+
+    Args:
+        prompt (str): Prompt serialized by LangChain (JSON message list)
+
+    Returns:
+        str: Hex digest of the system message contents
+    """
+    system = _split_messages(prompt)[0]
+    contents = json.dumps([message.get("content", "") for message in system])
+    return hashlib.sha256(contents.encode()).hexdigest()[:16]
+
+
+def _conversation_text(data: Dict[str, Any], **_: Any) -> str:
+    """
+    Build the text embedded for a semantic cache lookup.
+
+    Args:
+        data (dict): GPTCache request data with the serialized prompt
+
+    Returns:
+        str: Conversation without system messages, one "role: text" per line
+    """
+    prompt = data.get("prompt")
+    messages = _chat_messages(prompt)
+    if not messages:
+        return prompt
+
+    return "\n".join(
+        f"{message.get('type')}: {message.get('content', '')}"
+        for message in messages
+    )
+
+
+@lru_cache(maxsize=1)
+def _get_embedding() -> "QuantizedMiniLM":
+    """Load the sentence embedder once and share it between LLM caches"""
+    from embedding import QuantizedMiniLM
+
+    return QuantizedMiniLM()
+
+
+def _init_gptcache(cache_obj: "Cache", llm_string: str):
+    """
+    Initialize a similarity cache for one LLM configuration.
+
+    LangChain calls this once per distinct llm_string (model + temperature,
+    plus the system prompt digest added by ConversationAwareCache), so
+    urgent and casual answers never mix and FAQ edits start a fresh cache.
+    """
+    from gptcache.adapter.api import init_similar_cache
+    from gptcache.config import Config
+    from gptcache.manager import manager_factory
+    from gptcache.similarity_evaluation import SearchDistanceEvaluation
+
+    from embedding import MODEL_REPO
+
+    # Vectors from different embedders are not comparable, so the model is
+    # part of the directory key along with the LLM settings
+    hashed_llm = hashlib.sha256(f"{MODEL_REPO}:{llm_string}".encode()).hexdigest()[:16]
+    embedding = _get_embedding()
+    data_manager = manager_factory(
+        "sqlite,faiss",
+        data_dir=f"{CACHE_DIR}/{hashed_llm}",
+        vector_params={"dimension": embedding.dimension},
+        eviction_params={"max_size": CACHE_SIZE, "eviction": "LRU"},
+    )
+    # FAISS returns squared L2 distance; for unit vectors that is
+    # 2 * (1 - cosine), scored as max_distance - distance. GPTCache accepts
+    # scores >= max_distance * threshold, so cosine >= 2 * threshold - 1.
+    init_similar_cache(
+        cache_obj=cache_obj,
+        pre_func=_conversation_text,
+        embedding=embedding,
+        data_manager=data_manager,
+        evaluation=SearchDistanceEvaluation(max_distance=4.0),
+        config=Config(similarity_threshold=(1 + MIN_COSINE_SIMILARITY) / 2),
+    )
+
+
+class LRUCache(BaseCache):
+    """
+    In-memory LLM cache holding at most maxsize entries.
+
+    The least recently used entry is evicted when the cache is full, so
+    memory stays bounded in long-running processes.
+    """
+
+    def __init__(self, maxsize: int = 1024):
+        if maxsize <= 0:
+            raise ValueError(f"maxsize must be positive, got {maxsize}")
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[Tuple[str, str], RETURN_VAL_TYPE]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def lookup(self, prompt: str, llm_string: str) -> Optional[RETURN_VAL_TYPE]:
+        key = (prompt, llm_string)
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+            return value
+
+    def update(self, prompt: str, llm_string: str, return_val: RETURN_VAL_TYPE) -> None:
+        key = (prompt, llm_string)
+        with self._lock:
+            self._entries[key] = return_val
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self, **kwargs: Any) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    async def alookup(self, prompt: str, llm_string: str) -> Optional[RETURN_VAL_TYPE]:
+        return self.lookup(prompt, llm_string)
+
+    async def aupdate(self, prompt: str, llm_string: str, return_val: RETURN_VAL_TYPE) -> None:
+        self.update(prompt, llm_string, return_val)
+
+    async def aclear(self, **kwargs: Any) -> None:
+        self.clear()
+
+
+class ConversationAwareCache(BaseCache):
+    """
+    Semantic cache for opening questions, exact-match cache for follow-ups.
+
+    A follow-up such as "What about weekends?" only makes sense together
+    with its chat history, so it must never be answered from a similar
+    question asked in another conversation. Prompts with history are
+    keyed on the full prompt instead, like the other backends.
+
+    Semantic lookups ignore the system messages when comparing questions,
+    so their digest is appended to llm_string - each version of the FAQ
+    text gets its own semantic cache.
+    """
+
+    def __init__(self, semantic: BaseCache, exact: BaseCache):
+        self.semantic = semantic
+        self.exact = exact
+
+    def _select(self, prompt: str, llm_string: str) -> Tuple[BaseCache, str]:
+        if len(_chat_messages(prompt)) > 1:
+            return self.exact, llm_string
+        return self.semantic, f"{llm_string}:{_system_digest(prompt)}"
+
+    def lookup(self, prompt: str, llm_string: str) -> Optional[RETURN_VAL_TYPE]:
+        backend, key = self._select(prompt, llm_string)
+        return backend.lookup(prompt, key)
+
+    def update(self, prompt: str, llm_string: str, return_val: RETURN_VAL_TYPE) -> None:
+        backend, key = self._select(prompt, llm_string)
+        backend.update(prompt, key, return_val)
+
+    def clear(self, **kwargs: Any) -> None:
+        self.semantic.clear(**kwargs)
+        self.exact.clear(**kwargs)
+
+    async def alookup(self, prompt: str, llm_string: str) -> Optional[RETURN_VAL_TYPE]:
+        backend, key = self._select(prompt, llm_string)
+        return await backend.alookup(prompt, key)
+
+    async def aupdate(self, prompt: str, llm_string: str, return_val: RETURN_VAL_TYPE) -> None:
+        backend, key = self._select(prompt, llm_string)
+        await backend.aupdate(prompt, key, return_val)
+
+    async def aclear(self, **kwargs: Any) -> None:
+        await self.semantic.aclear(**kwargs)
+        await self.exact.aclear(**kwargs)
+
+
+# Lookup results for the chat turn in progress (see track_cache_hits)
+_lookup_results: ContextVar[Optional[List[bool]]] = ContextVar("lookup_results", default=None)
+
+
+class HitTrackingCache(BaseCache):
+    """
+    Wraps an LLM cache and records whether each lookup was a hit.
+
+    LangChain fires the same callbacks for cached and fresh generations,
+    so the cache itself is the only reliable place to observe hits.
+    A failing backend is logged and treated as a miss, so cache trouble
+    never fails a chat turn.
+    """
+
+    def __init__(self, backend: BaseCache):
+        self.backend = backend
+
+    def _record(self, value: Optional[RETURN_VAL_TYPE]) -> Optional[RETURN_VAL_TYPE]:
+        results = _lookup_results.get()
+        if results is not None:
+            results.append(value is not None)
+        return value
+
+    def lookup(self, prompt: str, llm_string: str) -> Optional[RETURN_VAL_TYPE]:
+        try:
+            value = self.backend.lookup(prompt, llm_string)
+        except Exception as e:
+            logger.warning("⚠️ Cache lookup failed, calling the API: %s", e)
+            value = None
+        return self._record(value)
+
+    def update(self, prompt: str, llm_string: str, return_val: RETURN_VAL_TYPE) -> None:
+        try:
+            self.backend.update(prompt, llm_string, return_val)
+        except Exception as e:
+            logger.warning("⚠️ Cache update failed, response not cached: %s", e)
+
+    def clear(self, **kwargs: Any) -> None:
+        self.backend.clear(**kwargs)
+
+    async def alookup(self, prompt: str, llm_string: str) -> Optional[RETURN_VAL_TYPE]:
+        try:
+            value = await self.backend.alookup(prompt, llm_string)
+        except Exception as e:
+            logger.warning("⚠️ Cache lookup failed, calling the API: %s", e)
+            value = None
+        return self._record(value)
+
+    async def aupdate(self, prompt: str, llm_string: str, return_val: RETURN_VAL_TYPE) -> None:
+        try:
+            await self.backend.aupdate(prompt, llm_string, return_val)
+        except Exception as e:
+            logger.warning("⚠️ Cache update failed, response not cached: %s", e)
+
+    async def aclear(self, **kwargs: Any) -> None:
+        await self.backend.aclear(**kwargs)
+
+
+@contextmanager
+def track_cache_hits() -> Iterator[List[bool]]:
+    """
+    Record cache lookups made by LLM calls inside the block.
+
+    Yields:
+        list: One entry per lookup - True if served from cache
+
+    Example:
+        with track_cache_hits() as lookups:
+            chain.invoke(...)
+        cached = bool(lookups) and all(lookups)
+    """
+    results: List[bool] = []
+    token = _lookup_results.set(results)
+    try:
+        yield results
+    finally:
+        _lookup_results.reset(token)
+
+
+def _create_backend(name: str) -> BaseCache:
+    """
+    Create the LLM cache backend selected by LLM_CACHE_BACKEND.
+
+    Args:
+        name (str): "semantic", "sqlite", "redis" or "memory"
+
+    Returns:
+        BaseCache: Cache backend instance
+    """
+    if name == "semantic":
+        from langchain_community.cache import GPTCache
+
+        # Load (and on first run download + quantize) the embedder now
+        # rather than inside the first chat turn
+        _get_embedding()
+        return ConversationAwareCache(
+            semantic=GPTCache(_init_gptcache),
+            exact=LRUCache(maxsize=CACHE_SIZE)
+        )
+
+    if name == "sqlite":
+        from langchain_community.cache import SQLiteCache
+        return SQLiteCache(database_path=CACHE_PATH)
+
+    if name == "redis":
+        import redis
+        from langchain_community.cache import RedisCache
+        return RedisCache(redis.Redis.from_url(REDIS_URL))
+
+    if name == "memory":
+        return LRUCache(maxsize=CACHE_SIZE)
+
+    raise ValueError(
+        f"Unknown LLM_CACHE_BACKEND '{name}' (use semantic, sqlite, redis or memory)"
+    )
+
+
+_BACKEND_DESCRIPTIONS = {
+    "semantic": f"similar questions reuse cached responses (max {CACHE_SIZE})",
+    "sqlite": f"responses persisted to {CACHE_PATH}",
+    "redis": f"responses shared via {REDIS_URL}",
+    "memory": f"responses cached in memory until exit (max {CACHE_SIZE})",
+}
+
+# Create cache instance. Without the embedding model (e.g. Hugging Face
+# unreachable on first run) fall back to exact matching, like the baseline
+# in-memory cache, instead of failing every request.
+try:
+    _backend = _create_backend(CACHE_BACKEND)
+except Exception as e:
+    if CACHE_BACKEND != "semantic":
+        raise
+    logger.warning("⚠️ Semantic cache unavailable (%s) - falling back to memory", e)
+    CACHE_BACKEND = "memory"
+    _backend = _create_backend(CACHE_BACKEND)
+
+cache = HitTrackingCache(_backend)
 
 # Enable caching globally
 set_llm_cache(cache)
 
-print("✅ Cache enabled - responses will be cached in memory")
\ No newline at end of file
+logger.info(
+    "✅ Cache enabled (%s) - %s", CACHE_BACKEND, _BACKEND_DESCRIPTIONS[CACHE_BACKEND]
+)
@@ -0,0 +1,107 @@
+"""
+Embedding Module
+Int8-quantized MiniLM sentence embeddings for the semantic cache
+
+The all-MiniLM-L6-v2 ONNX export is downloaded once, its weights are
+quantized to int8 and the result is run with ONNX Runtime on the CPU.
+"""
+
+import os
+import tempfile
+from typing import Any
+
+import numpy as np
+
+# Hugging Face model providing the tokenizer and the FP32 ONNX export
+MODEL_REPO = "sentence-transformers/all-MiniLM-L6-v2"
+
+# Directory where the quantized model is stored
+MODEL_DIR = os.getenv("EMBEDDING_MODEL_DIR", ".models")
+
+# Longest input (in tokens) the model was trained on
+MAX_LENGTH = 256
+
+
+def quantize_model(output_path: str) -> str:
+    """
+    Create the int8 model unless it already exists.
+
+    Args:
+        output_path (str): Where to write the quantized ONNX model
+
+    Returns:
+        str: Path to the quantized model
+    """
+    if not os.path.exists(output_path):
+        from huggingface_hub import hf_hub_download
+        from onnxruntime.quantization import QuantType, quantize_dynamic
+
+        model_path = hf_hub_download(MODEL_REPO, "onnx/model.onnx")
+        output_dir = os.path.dirname(output_path) or "."
+        os.makedirs(output_dir, exist_ok=True)
+
+        # Write to a temporary file and move it into place, so an
+        # interrupted run never leaves a truncated model behind
+        fd, tmp_path = tempfile.mkstemp(suffix=".onnx", dir=output_dir)
+        os.close(fd)
+        try:
+            quantize_dynamic(model_path, tmp_path, weight_type=QuantType.QInt8)
+            os.replace(tmp_path, output_path)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    return output_path
+
+
+class QuantizedMiniLM:
+    """
+    MiniLM sentence embedder backed by an int8 ONNX Runtime session.
+
+    Implements the GPTCache embedding interface (to_embeddings, dimension).
+    Vectors are mean-pooled and L2-normalized, so FAISS L2 search ranks
+    them the same as cosine similarity.
+    """
+
+    def __init__(self, model_dir: str = MODEL_DIR):
+        import onnxruntime as ort
+        from tokenizers import Tokenizer
+
+        self.tokenizer = Tokenizer.from_pretrained(MODEL_REPO)
+        self.tokenizer.enable_truncation(max_length=MAX_LENGTH)
+
+        model_path = quantize_model(os.path.join(model_dir, "all-MiniLM-L6-v2.int8.onnx"))
+        self.session = ort.InferenceSession(model_path, providers=["CPUExecutionProvider"])
+        self._input_names = {node.name for node in self.session.get_inputs()}
+
+    def to_embeddings(self, data: str, **_: Any) -> np.ndarray:
+        """
+        Embed one text.
+
+        Args:
+            data (str): Text to embed
+
+        Returns:
+            np.ndarray: Normalized float32 vector of length dimension
+        """
+        encoding = self.tokenizer.encode(data)
+        attention_mask = np.array([encoding.attention_mask], dtype=np.int64)
+        inputs = {
+            "input_ids": np.array([encoding.ids], dtype=np.int64),
+            "attention_mask": attention_mask,
+            "token_type_ids": np.array([encoding.type_ids], dtype=np.int64),
+        }
+        inputs = {name: value for name, value in inputs.items() if name in self._input_names}
+
+        last_hidden_state = self.session.run(None, inputs)[0]
+
+        # Mean pooling over real tokens, then L2 normalization
+        mask = attention_mask[..., None].astype(np.float32)
+        pooled = (last_hidden_state * mask).sum(axis=1) / np.clip(mask.sum(axis=1), 1e-9, None)
+        vector = pooled[0]
+        return (vector / np.linalg.norm(vector)).astype(np.float32)
+
+    @property
+    def dimension(self) -> int:
+        """Length of the embedding vectors"""
+        return 384
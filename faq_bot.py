@@ -8,22 +8,143 @@ Features:
 - Statistics tracking
 """
 
+import asyncio
+import atexit
+import hashlib
+import json
+import logging
 import os
+import queue
+import sys
+import threading
 import time
+from collections import deque
+from dataclasses import asdict, dataclass
 from datetime import datetime
-from typing import List, Dict
-from dotenv import load_dotenv
+from logging.handlers import QueueHandler, QueueListener
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Deque, Dict, List, Mapping, Optional, Tuple
 
-from langchain_openai import ChatOpenAI
-from langchain_core.messages import HumanMessage, AIMessage, SystemMessage
-from langchain_core.prompts import ChatPromptTemplate, MessagesPlaceholder
+# Import our custom modules (stdlib only - LangChain is imported on first use
+# so importing this module stays fast)
+from urgency import CASUAL_TEMPERATURE, URGENT_TEMPERATURE, classify
+from router import route
 
-# Import our custom modules
-import cache  # This enables caching
-from urgency import detect_urgency, get_urgency_level
+if TYPE_CHECKING:
+    from langchain_core.runnables import Runnable
+    from langchain_openai import ChatOpenAI
 
-# Load environment variables
-load_dotenv()
+
+def _stdout_handler() -> logging.Handler:
+    """Handler printing bare messages to stdout"""
+    handler = logging.StreamHandler(sys.stdout)
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    return handler
+
+
+# Diagnostics (startup info, statistics, per-turn timing) go through this
+# logger. By default it prints synchronously, so show_stats() and friends
+# work for every caller; setup_logging() moves output to a background thread.
+logger = logging.getLogger("faq")
+_default_handler = _stdout_handler()
+logger.addHandler(_default_handler)
+logger.setLevel(logging.INFO)
+logger.propagate = False
+
+# Queue of pending log records and its background writer (see setup_logging)
+_log_queue: Optional[queue.Queue] = None
+_log_listener: Optional[QueueListener] = None
+
+
+def setup_logging():
+    """
+    Print chatbot diagnostics from a background thread.
+    
+    Log calls only put records on a queue; a QueueListener thread writes
+    them to stdout, so diagnostics never block the response path.
+    """
+    global _log_queue, _log_listener
+    
+    if _log_listener is not None:
+        return
+    
+    # queue.Queue (not SimpleQueue) so the listener marks each record
+    # task_done() and flush_logs() can join() on it
+    _log_queue = queue.Queue()
+    
+    _log_listener = QueueListener(_log_queue, _stdout_handler())
+    _log_listener.start()
+    atexit.register(_log_listener.stop)
+    
+    logger.removeHandler(_default_handler)
+    logger.addHandler(QueueHandler(_log_queue))
+
+
+def flush_logs():
+    """Wait until all queued log records have been written"""
+    if _log_queue is not None:
+        _log_queue.join()
+
+
+# FAQ Knowledge Base
+_FAQ_DATA = MappingProxyType({
+    "hours": "We're open Monday-Friday 9 AM - 6 PM, Saturday 10 AM - 4 PM, closed Sunday.",
+    "location": "We're located at 123 Main Street, Downtown, New York, NY 10001.",
+    "contact": "You can reach us at (555) 123-4567 or email support@example.com",
+    "returns": "Returns accepted within 30 days with receipt. Full refund or exchange available.",
+    "shipping": "Free shipping on orders over $50. Standard delivery: 3-5 business days. Express: 1-2 days.",
+    "payment": "We accept Visa, MasterCard, American Express, PayPal, and Apple Pay.",
+    "warranty": "All products come with a 1-year manufacturer warranty.",
+    "track_order": "You can track your order at example.com/track using your order number."
+})
+
+
+# Static instructions - identical for every call, so the prompt prefix stays stable
+_SYSTEM_PROMPT = """You are a helpful and friendly customer support assistant.
+
+INSTRUCTIONS:
+- Answer questions accurately using the FAQ knowledge provided
+- For urgent queries: Be direct, concise, and action-oriented
+- For casual queries: Be friendly, conversational, and helpful
+- If you don't know something, be honest and offer to connect them with support
+- Always maintain a professional yet warm tone"""
+
+
+def _render_faq_blocks(faq_data: Mapping[str, str]) -> Dict[str, str]:
+    """Render one knowledge-base line per FAQ topic"""
+    return {
+        key: f"- {key.upper()}: {value}"
+        for key, value in faq_data.items()
+    }
+
+
+# Rendered once at import and shared by every chatbot instance
+_FAQ_BLOCKS = _render_faq_blocks(_FAQ_DATA)
+
+# Short content hash identifying this version of the FAQ data
+_FAQ_VERSION = hashlib.md5(
+    json.dumps(dict(_FAQ_DATA), sort_keys=True).encode()
+).hexdigest()[:8]
+
+
+# FAQ knowledge message sent with every turn - all topics in a stable order,
+# so the model never has to guess and the prompt prefix stays identical
+_FAQ_CONTEXT = "📋 FAQ KNOWLEDGE BASE:\n" + "\n".join(_FAQ_BLOCKS.values())
+
+
+# Number of recent question/answer turns sent back to the model
+MAX_HISTORY_TURNS = 10
+
+
+@dataclass(slots=True)
+class Stats:
+    """Per-chatbot counters (fixed fields, updated every turn)"""
+    total_queries: int = 0
+    urgent_queries: int = 0
+    casual_queries: int = 0
+    cache_hits: int = 0
+    cache_misses: int = 0
+    total_time_ns: int = 0
 
 
 class FAQChatbot:
@@ -39,95 +160,222 @@ class FAQChatbot:
             model (str): OpenAI model to use (default: gpt-3.5-turbo)
         """
         
-        # Chat history
-        self.chat_history: List = []
+        import httpx
+        from langchain_core.prompts import ChatPromptTemplate, MessagesPlaceholder
+        from langchain_openai import ChatOpenAI
+        
+        import cache  # This enables caching
+        
+        # Chat history (sliding window - oldest messages drop off automatically)
+        self.chat_history: Deque = deque(maxlen=2 * MAX_HISTORY_TURNS)
         
         # Statistics
-        self.stats = {
-            "total_queries": 0,
-            "urgent_queries": 0,
-            "casual_queries": 0,
-            "cache_hits": 0,
-            "cache_misses": 0,
-            "total_time": 0.0
-        }
+        self.stats = Stats()
         
-        # FAQ Knowledge Base
-        self.faq_data = {
-            "hours": "We're open Monday-Friday 9 AM - 6 PM, Saturday 10 AM - 4 PM, closed Sunday.",
-            "location": "We're located at 123 Main Street, Downtown, New York, NY 10001.",
-            "contact": "You can reach us at (555) 123-4567 or email support@example.com",
-            "returns": "Returns accepted within 30 days with receipt. Full refund or exchange available.",
-            "shipping": "Free shipping on orders over $50. Standard delivery: 3-5 business days. Express: 1-2 days.",
-            "payment": "We accept Visa, MasterCard, American Express, PayPal, and Apple Pay.",
-            "warranty": "All products come with a 1-year manufacturer warranty.",
-            "track_order": "You can track your order at example.com/track using your order number."
-        }
+        # Guards statistics when chat/achat calls overlap
+        self._stats_lock = threading.Lock()
+        
+        # API requests in progress, keyed by prompt - identical concurrent
+        # achat calls share one request instead of each calling the API
+        self._inflight: Dict[Tuple, asyncio.Future] = {}
+        
+        # FAQ Knowledge Base (shared, read-only)
+        self.faq_data = _FAQ_DATA
         
         # Store model name
         self.model_name = model
         
-        # Current LLM instance (will be recreated based on temperature)
-        self.current_llm = None
-        self.current_temperature = None
-        
         # Create prompt template
         self.prompt = ChatPromptTemplate.from_messages([
-            ("system", self._get_system_prompt()),
+            ("system", _SYSTEM_PROMPT),
+            ("system", "{faq_context}"),
             MessagesPlaceholder(variable_name="chat_history"),
             ("human", "{input}")
         ])
         
-        print("🤖 FAQ Chatbot initialized successfully!")
-        print(f"📊 Model: {self.model_name}")
-        print(f"💾 Caching: Enabled")
-        print(f"🚦 Dynamic Temperature: Enabled\n")
+        # HTTP connection pools (HTTP/2, keep-alive) shared by both LLMs, so
+        # the TLS handshake happens once rather than once per LLM
+        limits = httpx.Limits(max_keepalive_connections=8)
+        self._http_client = httpx.Client(http2=True, limits=limits)
+        self._http_async_client = httpx.AsyncClient(http2=True, limits=limits)
+        self._close_task: Optional[asyncio.Task] = None
+        
+        # One LLM and prompt | LLM chain per temperature, built up front so
+        # switching between urgent and casual turns is a dict lookup
+        self._llms: Dict[float, "ChatOpenAI"] = {
+            temperature: ChatOpenAI(
+                model=self.model_name,
+                temperature=temperature,
+                max_tokens=300,
+                api_key=os.environ.get("OPENROUTER_API_KEY"),
+                base_url="https://openrouter.ai/api/v1",
+                http_client=self._http_client,
+                http_async_client=self._http_async_client,
+                cache=True  # Enable caching
+            )
+            for temperature in (URGENT_TEMPERATURE, CASUAL_TEMPERATURE)
+        }
+        self._chains: Dict[float, "Runnable"] = {
+            temperature: self.prompt | llm
+            for temperature, llm in self._llms.items()
+        }
+        
+        logger.info("🤖 FAQ Chatbot initialized successfully!")
+        logger.info("📊 Model: %s", self.model_name)
+        logger.info("📚 FAQ Version: %s", _FAQ_VERSION)
+        logger.info("💾 Caching: Enabled")
+        logger.info("🚦 Dynamic Temperature: Enabled\n")
     
-    def _get_system_prompt(self) -> str:
-        """Generate system prompt with FAQ knowledge"""
+    def close(self):
+        """
+        Close both shared HTTP connection pools (chat and achat)
         
-        faq_text = "\n".join([
-            f"- {key.upper()}: {value}" 
-            for key, value in self.faq_data.items()
-        ])
+        Inside a running event loop the async pool can't be closed right
+        away, so closing is scheduled on that loop; prefer aclose() (or
+        async with) there.
+        """
+        self._http_client.close()
+        if self._http_async_client.is_closed:
+            return
         
-        return f"""You are a helpful and friendly customer support assistant.
-
-📋 FAQ KNOWLEDGE BASE:
-{faq_text}
-
-INSTRUCTIONS:
-- Answer questions accurately using the FAQ knowledge above
-- For urgent queries: Be direct, concise, and action-oriented
-- For casual queries: Be friendly, conversational, and helpful
-- If you don't know something, be honest and offer to connect them with support
-- Always maintain a professional yet warm tone"""
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            asyncio.run(self._http_async_client.aclose())
+        else:
+            # Keep a reference so the task isn't garbage collected early
+            self._close_task = loop.create_task(self._http_async_client.aclose())
+    
+    async def aclose(self):
+        """Close both shared HTTP connection pools (chat and achat)"""
+        self._http_client.close()
+        await self._http_async_client.aclose()
+    
+    def __enter__(self) -> "FAQChatbot":
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.close()
+    
+    async def __aenter__(self) -> "FAQChatbot":
+        return self
     
-    def _get_llm(self, temperature: float) -> ChatOpenAI:
+    async def __aexit__(self, *exc_info):
+        await self.aclose()
+    
+    def _get_chain(self, temperature: float) -> "Runnable":
         """
-        Get LLM instance with specified temperature
-        Reuses instance if temperature hasn't changed
+        Get prompt | LLM chain for specified temperature
         
         Args:
             temperature (float): Temperature setting
         
         Returns:
-            ChatOpenAI: LLM instance
+            Runnable: Chain built at startup
+        """
+        return self._chains[temperature]
+    
+    def _start_turn(self, user_input: str) -> Tuple[float, str]:
         """
+        Detect urgency and count the query
         
-        # Only create new LLM if temperature changed
-        if self.current_llm is None or self.current_temperature != temperature:
-            self.current_llm = ChatOpenAI(
-                model=self.model_name,
-                temperature=temperature,
-                max_tokens=300,
-                api_key=os.environ.get("OPENROUTER_API_KEY"),
-                base_url="https://openrouter.ai/api/v1",
-                cache=True  # Enable caching
-            )
-            self.current_temperature = temperature
+        Args:
+            user_input (str): User's message
+        
+        Returns:
+            tuple: (temperature, urgency_level)
+        """
         
-        return self.current_llm
+        # Detect urgency and get appropriate temperature
+        temperature, urgency_level = classify(user_input)
+        
+        # Update statistics
+        with self._stats_lock:
+            self.stats.total_queries += 1
+            if urgency_level == "URGENT":
+                self.stats.urgent_queries += 1
+            else:
+                self.stats.casual_queries += 1
+        
+        return temperature, urgency_level
+    
+    def _route(self, user_input: str, urgency_level: str, history: List) -> Optional[str]:
+        """
+        Get FAQ topic to answer locally, if the canned answer is enough
+        
+        Urgent messages usually describe a problem the FAQ text doesn't
+        solve, and follow-ups depend on the conversation, so both always
+        go to the model.
+        
+        Args:
+            user_input (str): User's message
+            urgency_level (str): "URGENT" or "CASUAL"
+            history (list): Chat history sent with this turn
+        
+        Returns:
+            str or None: FAQ topic key, or None to ask the model
+        """
+        if urgency_level == "URGENT" or history:
+            return None
+        return route(user_input)
+    
+    def _chain_inputs(self, user_input: str, history: List) -> Dict:
+        """Build prompt variables for the current turn"""
+        return {
+            "faq_context": _FAQ_CONTEXT,
+            "chat_history": history,
+            "input": user_input
+        }
+    
+    def _respond(self, user_input: str, answer: str, urgency_level: str,
+                 temperature: float, cached: bool, tokens: Dict,
+                 start_ns: int, use_history: bool = True) -> Dict:
+        """
+        Record a completed turn and build the response data
+        
+        Args:
+            user_input (str): User's message
+            answer (str): Bot's reply
+            urgency_level (str): "URGENT" or "CASUAL"
+            temperature (float): Temperature used for the reply
+            cached (bool): Whether the reply was served without an API call
+            tokens (dict): Token usage reported by the API
+            start_ns (int): time.perf_counter_ns() when the turn started
+            use_history (bool): Append the turn to the chat history
+        
+        Returns:
+            dict: Response data including message, temperature, timing, etc.
+        """
+        
+        from langchain_core.messages import AIMessage, HumanMessage
+        
+        # Update history
+        if use_history:
+            self.chat_history.append(HumanMessage(content=user_input))
+            self.chat_history.append(AIMessage(content=answer))
+        
+        # Calculate timing
+        elapsed_ns = time.perf_counter_ns() - start_ns
+        
+        with self._stats_lock:
+            self.stats.total_time_ns += elapsed_ns
+            
+            # Count cache hit (reported by the cache itself)
+            if cached:
+                self.stats.cache_hits += 1
+            else:
+                self.stats.cache_misses += 1
+        
+        # Return detailed response
+        return {
+            "success": True,
+            "message": answer,
+            "urgency": urgency_level,
+            "temperature": temperature,
+            "time": elapsed_ns / 1e9,
+            "cached": cached,
+            "tokens": tokens
+        }
     
     def chat(self, user_input: str) -> Dict:
         """
@@ -140,56 +388,102 @@ INSTRUCTIONS:
             dict: Response data including message, temperature, timing, etc.
         """
         
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
+        temperature, urgency_level = self._start_turn(user_input)
+        history = list(self.chat_history)
         
-        # Detect urgency and get appropriate temperature
-        temperature = detect_urgency(user_input)
-        urgency_level = get_urgency_level(user_input)
+        # Answer unambiguous FAQ questions locally (no API call)
+        topic = self._route(user_input, urgency_level, history)
+        if topic is not None:
+            return self._respond(user_input, self.faq_data[topic], urgency_level,
+                                 temperature, True, {}, start_ns)
         
-        # Update statistics
-        self.stats["total_queries"] += 1
-        if urgency_level == "URGENT":
-            self.stats["urgent_queries"] += 1
-        else:
-            self.stats["casual_queries"] += 1
-        
-        # Get LLM with appropriate temperature
-        llm = self._get_llm(temperature)
+        from cache import track_cache_hits
         
-        # Create chain
-        chain = self.prompt | llm
+        # Get chain with appropriate temperature
+        chain = self._get_chain(temperature)
         
         # Invoke chain
         try:
-            response = chain.invoke({
-                "chat_history": self.chat_history,
-                "input": user_input
-            })
-            
-            # Update history
-            self.chat_history.append(HumanMessage(content=user_input))
-            self.chat_history.append(AIMessage(content=response.content))
-            
-            # Calculate timing
-            elapsed_time = time.time() - start_time
-            self.stats["total_time"] += elapsed_time
+            with track_cache_hits() as lookups:
+                response = chain.invoke(self._chain_inputs(user_input, history))
             
-            # Estimate cache hit (very fast = likely cached)
-            if elapsed_time < 0.1:
-                self.stats["cache_hits"] += 1
-            else:
-                self.stats["cache_misses"] += 1
-            
-            # Return detailed response
+            return self._respond(
+                user_input, response.content, urgency_level, temperature,
+                bool(lookups) and all(lookups),
+                response.response_metadata.get("token_usage", {}),
+                start_ns
+            )
+        
+        except Exception as e:
             return {
-                "success": True,
-                "message": response.content,
+                "success": False,
+                "error": str(e),
                 "urgency": urgency_level,
-                "temperature": temperature,
-                "time": elapsed_time,
-                "cached": elapsed_time < 0.1,
-                "tokens": response.response_metadata.get("token_usage", {})
+                "temperature": temperature
             }
+    
+    async def achat(self, user_input: str, use_history: bool = True) -> Dict:
+        """
+        Process user input and generate response without blocking
+        
+        Several achat calls can run at once (e.g. with asyncio.gather),
+        so independent questions wait on the API in parallel and
+        identical ones share a single API call.
+        
+        Concurrent calls with use_history=True all share this bot's single
+        conversation: each sees whatever turns finished before it started,
+        and turns are appended in completion order. Pass use_history=False
+        for independent questions - the turn is answered as the opening
+        message of a fresh conversation and is not added to the history.
+        
+        Args:
+            user_input (str): User's message
+            use_history (bool): Read and extend the shared chat history
+        
+        Returns:
+            dict: Response data including message, temperature, timing, etc.
+        """
+        
+        start_ns = time.perf_counter_ns()
+        temperature, urgency_level = self._start_turn(user_input)
+        history = list(self.chat_history) if use_history else []
+        
+        # Answer unambiguous FAQ questions locally (no API call)
+        topic = self._route(user_input, urgency_level, history)
+        if topic is not None:
+            return self._respond(user_input, self.faq_data[topic], urgency_level,
+                                 temperature, True, {}, start_ns, use_history)
+        
+        from cache import track_cache_hits
+        
+        # Get chain with appropriate temperature
+        chain = self._get_chain(temperature)
+        
+        inputs = self._chain_inputs(user_input, history)
+        key = (
+            temperature,
+            user_input,
+            tuple((message.type, message.content) for message in inputs["chat_history"])
+        )
+        
+        # Invoke chain (or join an identical request already in flight)
+        try:
+            with track_cache_hits() as lookups:
+                request = self._inflight.get(key)
+                shared = request is not None
+                if not shared:
+                    request = asyncio.ensure_future(chain.ainvoke(inputs))
+                    self._inflight[key] = request
+                    request.add_done_callback(lambda _: self._inflight.pop(key, None))
+                response = await asyncio.shield(request)
+            
+            return self._respond(
+                user_input, response.content, urgency_level, temperature,
+                shared or (bool(lookups) and all(lookups)),
+                {} if shared else response.response_metadata.get("token_usage", {}),
+                start_ns, use_history
+            )
         
         except Exception as e:
             return {
@@ -201,39 +495,48 @@ INSTRUCTIONS:
     
     def clear_history(self):
         """Clear conversation history"""
-        self.chat_history = []
-        print("✅ Chat history cleared!")
+        self.chat_history.clear()
+        logger.info("✅ Chat history cleared!")
     
     def get_stats(self) -> Dict:
-        """Get chatbot statistics"""
-        return self.stats.copy()
+        """Get chatbot statistics (total_time in seconds)"""
+        stats = asdict(self.stats)
+        stats["total_time"] = stats.pop("total_time_ns") / 1e9
+        return stats
     
     def show_stats(self):
         """Display formatted statistics"""
         stats = self.stats
         
-        print("\n" + "="*60)
-        print("📊 CHATBOT STATISTICS")
-        print("="*60)
-        print(f"Total Queries:     {stats['total_queries']}")
-        print(f"  - Urgent:        {stats['urgent_queries']}")
-        print(f"  - Casual:        {stats['casual_queries']}")
-        print(f"\nCache Performance:")
-        print(f"  - Cache Hits:    {stats['cache_hits']} (estimated)")
-        print(f"  - Cache Misses:  {stats['cache_misses']} (estimated)")
-        
-        if stats['total_queries'] > 0:
-            avg_time = stats['total_time'] / stats['total_queries']
-            cache_rate = (stats['cache_hits'] / stats['total_queries']) * 100
-            print(f"\nPerformance:")
-            print(f"  - Avg Response:  {avg_time:.3f}s")
-            print(f"  - Cache Rate:    {cache_rate:.1f}%")
-        
-        print("="*60 + "\n")
+        lines = [
+            "\n" + "="*60,
+            "📊 CHATBOT STATISTICS",
+            "="*60,
+            f"Total Queries:     {stats.total_queries}",
+            f"  - Urgent:        {stats.urgent_queries}",
+            f"  - Casual:        {stats.casual_queries}",
+            f"\nCache Performance:",
+            f"  - Cache Hits:    {stats.cache_hits}",
+            f"  - Cache Misses:  {stats.cache_misses}",
+        ]
+        
+        if stats.total_queries > 0:
+            avg_time = stats.total_time_ns / stats.total_queries / 1e9
+            cache_rate = (stats.cache_hits / stats.total_queries) * 100
+            lines += [
+                f"\nPerformance:",
+                f"  - Avg Response:  {avg_time:.3f}s",
+                f"  - Cache Rate:    {cache_rate:.1f}%",
+            ]
+        
+        lines.append("="*60 + "\n")
+        logger.info("\n".join(lines))
     
     def run(self):
         """Run interactive chatbot"""
         
+        flush_logs()
+        
         print("="*60)
         print("🤖 SMART FAQ CHATBOT")
         print("="*60)
@@ -247,7 +550,8 @@ INSTRUCTIONS:
         
         while True:
             try:
-                # Get user input
+                # Get user input (after pending diagnostics are written)
+                flush_logs()
                 user_input = input("You: ").strip()
                 
                 # Skip empty input
@@ -258,6 +562,7 @@ INSTRUCTIONS:
                 if user_input.lower() in ['quit', 'exit']:
                     print("\n" + "="*60)
                     self.show_stats()
+                    flush_logs()
                     print("👋 Thank you for using FAQ Chatbot! Goodbye!")
                     print("="*60 + "\n")
                     break
@@ -283,11 +588,14 @@ INSTRUCTIONS:
                 if result["success"]:
                     # Show mode indicator
                     mode_emoji = "🚨" if result["urgency"] == "URGENT" else "💬"
-                    mode_text = f"{mode_emoji} {result['urgency']} MODE (temp={result['temperature']})"
                     cache_text = "📦 CACHED" if result["cached"] else "🌐 API CALL"
                     
-                    print(f"\n[{mode_text} | {cache_text} | {result['time']:.3f}s]")
-                    print(f"Bot: {result['message']}\n")
+                    print(f"\nBot: {result['message']}")
+                    logger.info(
+                        "[%s %s MODE (temp=%s) | %s | %.3fs]\n",
+                        mode_emoji, result["urgency"], result["temperature"],
+                        cache_text, result["time"]
+                    )
                 else:
                     print(f"\n❌ Error: {result['error']}\n")
                     
@@ -305,6 +613,11 @@ INSTRUCTIONS:
 def main():
     """Main function to run the chatbot"""
     
+    from dotenv import load_dotenv
+    
+    # Load environment variables
+    load_dotenv()
+    
     # Check for API key
     if not os.environ.get("OPENROUTER_API_KEY"):
         print("❌ ERROR: OPENROUTER_API_KEY not found in .env file!")
@@ -312,9 +625,11 @@ def main():
         print("OPENROUTER_API_KEY=sk-or-v1-xxxxx")
         return
     
+    setup_logging()
+    
     # Create and run chatbot
-    bot = FAQChatbot(model="openai/gpt-3.5-turbo")
-    bot.run()
+    with FAQChatbot(model="openai/gpt-3.5-turbo") as bot:
+        bot.run()
 
 
 if __name__ == "__main__":
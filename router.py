@@ -0,0 +1,141 @@
+"""
+FAQ Routing Module
+Maps user messages to FAQ topics so unambiguous questions can be
+answered locally without calling the LLM
+"""
+
+import re
+from typing import List, Optional
+
+# Keywords and phrases pointing at a single FAQ topic. Generic words
+# ("open", "pay", "ship", "refund", ...) are only listed inside phrases,
+# since on their own they show up in unrelated questions.
+_TOPIC_KEYWORDS = {
+    "hours": "hours", "opening times": "hours",
+    "are you open": "hours", "when do you close": "hours",
+    "location": "location", "address": "location", "located": "location",
+    "contact": "contact", "phone number": "contact", "email address": "contact",
+    "return policy": "returns", "returns": "returns", "refunds": "returns",
+    "refund policy": "returns", "get a refund": "returns",
+    "exchange policy": "returns", "exchanges": "returns",
+    "shipping": "shipping", "delivery": "shipping",
+    "payment": "payment", "pay with": "payment", "pay by": "payment", "paypal": "payment",
+    "visa": "payment", "mastercard": "payment", "american express": "payment",
+    "credit card": "payment",
+    "warranty": "warranty", "guarantee": "warranty",
+    "track my order": "track_order", "track an order": "track_order",
+    "track my package": "track_order", "order tracking": "track_order",
+}
+
+# Generic words that hint at another FAQ subject (or a problem) outside the
+# phrases above. They map to no topic, but stop a message from being routed,
+# so "Do you ship to Canada? And where are you located?" is not answered
+# with the address alone.
+_BLOCKER_WORDS = (
+    "open", "close", "closed", "closing",
+    "email", "phone", "call",
+    "return", "returned", "returning", "refund", "refunded", "exchange",
+    "ship", "shipped", "deliver", "delivered",
+    "pay", "paid", "charge", "charged",
+    "track", "tracking",
+)
+
+# Single compiled alternation - longest terms first, whole words only, so
+# a topic phrase ("return policy") wins over the blocker inside it ("return")
+_TERM_RE = re.compile(
+    r"\b(?:"
+    + "|".join(map(re.escape, sorted(
+        [*_TOPIC_KEYWORDS, *_BLOCKER_WORDS], key=len, reverse=True
+    )))
+    + r")\b",
+    re.IGNORECASE
+)
+
+# Sentence or question boundary followed by more text
+_SENTENCE_BREAK_RE = re.compile(r"[.?!]+\s+\S")
+
+
+def match_topics(text: str) -> List[str]:
+    """
+    Find every FAQ topic mentioned in user message.
+
+    Args:
+        text (str): User's message
+
+    Returns:
+        list: FAQ topic keys in order of first mention
+
+    Examples:
+        >>> match_topics("Can I pay with PayPal and get free shipping?")
+        ['payment', 'shipping']
+
+        >>> match_topics("I need to open an account")
+        []
+    """
+    topics = []
+    for match in _TERM_RE.finditer(text):
+        topic = _TOPIC_KEYWORDS.get(match.group(0).lower())
+        if topic is not None and topic not in topics:
+            topics.append(topic)
+    return topics
+
+
+def route(text: str) -> Optional[str]:
+    """
+    Get the FAQ topic that answers user message on its own.
+
+    Messages with several sentences or questions, or with a generic word
+    hinting at another subject, are never routed - a single canned answer
+    would only cover part of them.
+
+    Args:
+        text (str): User's message
+
+    Returns:
+        str or None: Topic key if exactly one topic matched, else None
+
+    Examples:
+        >>> route("What are your business hours?")
+        'hours'
+
+        >>> route("Do you ship to Canada? And where are you located?")
+
+        >>> route("Can I return it if the warranty expired?")
+
+        >>> route("I never received my refund")
+
+        >>> route("My package is broken!")
+    """
+    if _SENTENCE_BREAK_RE.search(text.strip()):
+        return None
+
+    topics = []
+    for match in _TERM_RE.finditer(text):
+        topic = _TOPIC_KEYWORDS.get(match.group(0).lower())
+        if topic is None:
+            return None
+        if topic not in topics:
+            topics.append(topic)
+    return topics[0] if len(topics) == 1 else None
+
+
+# Test the function if run directly
+if __name__ == "__main__":
+    test_messages = [
+        "What are your business hours?",
+        "Where is your location?",
+        "Do you accept PayPal?",
+        "Help!!! My package is broken!",
+        "I did not get a confirmation email",
+        "Can I pay with PayPal and get free shipping?",
+        "Do you ship to Canada? And where are you located?",
+        "What is the exchange rate for CAD?"
+    ]
+
+    print("🧪 Testing FAQ Routing\n")
+    print("=" * 60)
+
+    for msg in test_messages:
+        print(f"Message: {msg}")
+        print(f"Topics: {match_topics(msg)} | Route: {route(msg)}")
+        print("-" * 60)
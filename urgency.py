@@ -3,6 +3,58 @@ Urgency Detection Module
 Analyzes user messages to determine appropriate response temperature
 """
 
+import re
+from typing import Tuple
+
+# Keywords indicating urgent/critical situations
+_URGENT_KEYWORDS = [
+    "urgent", "urgently", 
+    "immediately", "immediate",
+    "asap", "a.s.a.p",
+    "right now", 
+    "help!", "help me",
+    "emergency", "critical",
+    "broken", "not working",
+    "problem", "issue"
+]
+
+# Temperatures for each urgency level
+URGENT_TEMPERATURE = 0.1  # Low temperature = focused, factual, direct
+CASUAL_TEMPERATURE = 0.9  # High temperature = creative, conversational, friendly
+
+# Runs of exclamation marks have no case, so a plain substring search
+# (no lowercased copy, no regex) catches them
+_EXCLAMATION_RUN = "!!!"
+
+# Single compiled alternation - one case-insensitive pass over the message
+_URGENT_RE = re.compile("|".join(map(re.escape, _URGENT_KEYWORDS)), re.IGNORECASE)
+
+
+def classify(text: str) -> Tuple[float, str]:
+    """
+    Detect urgency in user message in a single pass.
+    
+    Args:
+        text (str): User's message
+    
+    Returns:
+        tuple: (temperature, level) - (0.1, "URGENT") or (0.9, "CASUAL")
+    
+    Examples:
+        >>> classify("URGENT! Need help ASAP!")
+        (0.1, 'URGENT')
+        
+        >>> classify("Hey, just wondering about your hours")
+        (0.9, 'CASUAL')
+    """
+    
+    # Check if any urgent keyword is present
+    if _EXCLAMATION_RUN in text or _URGENT_RE.search(text):
+        return URGENT_TEMPERATURE, "URGENT"
+    
+    return CASUAL_TEMPERATURE, "CASUAL"
+
+
 def detect_urgency(text: str) -> float:
     """
     Detect urgency level in user message and return appropriate temperature.
@@ -20,28 +72,7 @@ def detect_urgency(text: str) -> float:
         >>> detect_urgency("Hey, just wondering about your hours")
         0.9
     """
-    
-    # Keywords indicating urgent/critical situations
-    urgent_keywords = [
-        "urgent", "urgently", 
-        "immediately", "immediate",
-        "asap", "a.s.a.p",
-        "right now", 
-        "help!", "help me",
-        "emergency", "critical",
-        "broken", "not working",
-        "problem", "issue",
-        "!!!", "!!!!"
-    ]
-    
-    # Convert to lowercase for case-insensitive matching
-    text_lower = text.lower()
-    
-    # Check if any urgent keyword is present
-    if any(word in text_lower for word in urgent_keywords):
-        return 0.1  # Low temperature = focused, factual, direct
-    
-    return 0.9  # High temperature = creative, conversational, friendly
+    return classify(text)[0]
 
 
 def get_urgency_level(text: str) -> str:
@@ -54,8 +85,7 @@ def get_urgency_level(text: str) -> str:
     Returns:
         str: "URGENT" or "CASUAL"
     """
-    temp = detect_urgency(text)
-    return "URGENT" if temp == 0.1 else "CASUAL"
+    return classify(text)[1]
 
 
 # Test the function if run directly
@@ -72,8 +102,7 @@ if __name__ == "__main__":
     print("=" * 60)
     
     for msg in test_messages:
-        temp = detect_urgency(msg)
-        level = get_urgency_level(msg)
+        temp, level = classify(msg)
         print(f"Message: {msg}")
         print(f"Level: {level} | Temperature: {temp}")
         print("-" * 60)
\ No newline at end of file